@@ -0,0 +1,495 @@
+import argparse
+import base64
+import hashlib
+import html
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, quote_plus, unquote, unquote_plus, urlsplit
+
+# Minimal 1x1 baseline JPEG, closed with an end-of-image marker; the scraper only writes the bytes to disk.
+PLACEHOLDER_JPEG = base64.b64decode(
+    '/9j/4AAQSkZJRgABAQEASABIAAD/2wBDAP//////////////////////////////////////'
+    '////////////////////////////////////////////////wgALCAABAAEBAREA/8QAFBAB'
+    'AAAAAAAAAAAAAAAAAAAAAP/aAAgBAQABPxA='
+) + b'\xff\xd9'
+
+SRINAGAR_BOUNDS = {
+    'min_lat': 33.8, 'max_lat': 34.3,
+    'min_lng': 74.6, 'max_lng': 74.9
+}
+
+AREAS = [
+    "Nowhatta", "Lal Chowk", "Dal Gate", "Rajbagh", "Jawahar Nagar", "Karan Nagar",
+    "Zaina Kadal", "Maharaj Ganj", "Hazratbal", "Nishat", "Shalimar", "Zadibal",
+    "Hawal", "Soura", "Sanat Nagar", "Hyderpora", "Batamaloo", "Chanapora",
+    "Bemina", "Khawaja Bazar", "Sarai Bala", "Alamgari Bazar"
+]
+
+MASJID_TEMPLATES = [
+    "Jamia Masjid {area}", "Masjid-e-{title}", "Masjid {title} {area}",
+    "Jama Masjid {area}", "{area} Mosque", "Dargah {title} Sahib",
+    "Khanqah-e-{title}", "Eidgah {area}", "Imam Bara {area}", "Islamic Center {area}"
+]
+
+MASJID_TITLES = [
+    "Noor", "Bilal", "Taqwa", "Rehmat", "Madina", "Quba", "Ali", "Umar",
+    "Tauheed", "Ahle Hadith", "Hanfia", "Mualla", "Sharief", "Naqshband"
+]
+
+OTHER_TEMPLATES = [
+    "{area} Bakery", "Hotel {area}", "{area} Medical Store", "{area} Boat House",
+    "{area} Handicrafts Emporium"
+]
+
+STREETS = ["Main", "Bund", "Residency", "Old Airport", "Foreshore", "Nallah Mar", "MA"]
+
+# Each amenity matches exactly one of the scraper's amenity keywords, and no
+# place name, area or street does, since the feed stays on the page and
+# extract_amenities scans the whole body text.
+AMENITIES = [
+    "Restroom", "Ablution area", "Shoes rack", "Air conditioning", "Heating",
+    "Library", "Madrasa", "Carpet", "Elevator", "Toilet", "Clock"
+]
+
+PAGE_STYLE = """
+body { margin: 0; font-family: Roboto, Arial, sans-serif; }
+#app { display: flex; align-items: flex-start; }
+#side { width: 420px; height: 100vh; display: flex; flex-direction: column; }
+#searchbox { padding: 12px; }
+#searchboxinput { width: 360px; padding: 8px; }
+div[role='feed'] { flex: 1; min-height: 0; overflow-y: auto; }
+div[role='feed'] a { display: block; height: 72px; padding: 8px 12px; border-bottom: 1px solid #ddd; color: inherit; text-decoration: none; }
+#pane { flex: 1; padding: 12px; }
+#consent { padding: 12px; background: #eef; }
+"""
+
+FEED_SCRIPT = """
+(function () {
+  var feed = document.querySelector("div[role='feed']");
+  var pane = document.getElementById('pane');
+  if (!feed) { return; }
+  var loading = false;
+  function loadMore() {
+    var next = feed.getAttribute('data-next');
+    if (loading || !next) { return; }
+    if (feed.scrollTop + feed.clientHeight < feed.scrollHeight - 200) { return; }
+    loading = true;
+    fetch(next).then(function (r) {
+      if (!r.ok) { throw new Error(r.status); }
+      return r.json();
+    }).then(function (page) {
+      feed.insertAdjacentHTML('beforeend', page.html);
+      feed.setAttribute('data-next', page.next || '');
+      loading = false;
+      loadMore();
+    }).catch(function () { loading = false; });
+  }
+  feed.addEventListener('scroll', loadMore);
+  loadMore();
+  feed.addEventListener('click', function (event) {
+    var link = event.target.closest('a[href*="/maps/place/"]');
+    if (!link) { return; }
+    event.preventDefault();
+    var href = link.getAttribute('href');
+    fetch(href + (href.indexOf('?') < 0 ? '?' : '&') + 'pane=1').then(function (r) {
+      return r.ok ? r.text() : '';
+    }).catch(function () { return ''; }).then(function (body) {
+      pane.innerHTML = body;
+      history.pushState({ place: href }, '', href);
+    });
+  });
+  window.addEventListener('popstate', function () { pane.innerHTML = ''; });
+})();
+"""
+
+
+def build_place_pool(seed, size):
+    """Build the deterministic set of synthetic places served by the stand-in."""
+    rng = random.Random(seed)
+    places = []
+
+    for place_id in range(1, size + 1):
+        area = rng.choice(AREAS)
+        if rng.random() < 0.8:
+            name = rng.choice(MASJID_TEMPLATES).format(area=area, title=rng.choice(MASJID_TITLES))
+        else:
+            name = rng.choice(OTHER_TEMPLATES).format(area=area)
+
+        # A few places fall outside Srinagar so coordinate validation is exercised
+        if rng.random() < 0.05:
+            lat, lng = rng.uniform(32.5, 33.5), rng.uniform(75.0, 75.5)
+        else:
+            lat = rng.uniform(SRINAGAR_BOUNDS['min_lat'], SRINAGAR_BOUNDS['max_lat'])
+            lng = rng.uniform(SRINAGAR_BOUNDS['min_lng'], SRINAGAR_BOUNDS['max_lng'])
+
+        places.append({
+            'id': place_id,
+            'name': name,
+            'area': area,
+            'latitude': round(lat, 7),
+            'longitude': round(lng, 7)
+        })
+
+    return places
+
+
+def place_details(place, seed):
+    """Derive address, amenities and image for a place, stable across requests."""
+    rng = random.Random(f"{seed}:place:{place['id']}")
+
+    address = ''
+    if rng.random() < 0.9:
+        address = (f"{rng.randint(1, 300)}, {rng.choice(STREETS)} Road, {place['area']}, "
+                   f"Srinagar, Jammu and Kashmir 1900{rng.randint(1, 25):02d}")
+
+    amenities = rng.sample(AMENITIES, rng.randint(0, 5))
+
+    image_path = ''
+    if rng.random() < 0.85:
+        token = hashlib.sha1(f"{seed}:{place['id']}".encode()).hexdigest()[:24]
+        image_path = f"/googleusercontent.com/p/AF1Qip{token}=w408-h306-k-no"
+
+    return {'address': address, 'amenities': amenities, 'image_path': image_path}
+
+
+def place_href(place):
+    """Build a Google Maps style place URL for a synthetic place."""
+    lat, lng = place['latitude'], place['longitude']
+    return (f"/maps/place/{quote_plus(place['name'])}/@{lat},{lng},17z/"
+            f"data=!4m6!3m5!1s0x0:0x{place['id']:x}!8m2!3d{lat}!4d{lng}")
+
+
+def search_results(pool, query, seed, count):
+    """Pick the places returned for a query; overlapping queries share places."""
+    rng = random.Random(f"{seed}:search:{query.strip().lower()}")
+    return rng.sample(pool, min(count, len(pool)))
+
+
+def render_feed_items(places):
+    """Render result cards for the search feed."""
+    items = []
+    for place in places:
+        items.append(
+            f'<a href="{html.escape(place_href(place))}" aria-label="{html.escape(place["name"])}">'
+            f'<div role="heading">{html.escape(place["name"])}</div>'
+            f'<span>{html.escape(place["area"])}, Srinagar</span></a>'
+        )
+    return ''.join(items)
+
+
+def render_place_pane(place, details):
+    """Render the place details pane using the markup the extractors look for."""
+    parts = [f'<h1>{html.escape(place["name"])}</h1>']
+
+    if details['image_path']:
+        parts.append(f'<div class="ZKCDEc"><img src="{html.escape(details["image_path"])}" alt="Photo"></div>')
+
+    if details['address']:
+        parts.append(
+            f'<button data-item-id="address" aria-label="Address: {html.escape(details["address"])}">'
+            f'{html.escape(details["address"])}</button>'
+        )
+
+    if details['amenities']:
+        rows = ''.join(f'<li>{html.escape(a)}</li>' for a in details['amenities'])
+        parts.append(f'<div aria-label="Amenities"><h2>Amenities</h2><ul>{rows}</ul></div>')
+
+    return ''.join(parts)
+
+
+def render_page(title, query='', feed='', pane='', consent=False):
+    """Render a full Maps-like page with search box, results feed and details pane."""
+    consent_html = ''
+    if consent:
+        consent_html = ('<div id="consent"><button onclick="this.parentNode.remove()">'
+                        'Accept all</button></div>')
+
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>{PAGE_STYLE}</style></head>
+<body>{consent_html}
+<div id="app">
+<div id="side">
+<form id="searchbox" action="/maps/search" method="get">
+<input id="searchboxinput" name="q" value="{html.escape(query)}" autocomplete="off">
+</form>
+{feed}
+</div>
+<div id="pane">{pane}</div>
+</div>
+<script>{FEED_SCRIPT}</script>
+</body></html>"""
+
+
+class StandinStats:
+    """Thread-safe request counters used to measure crawl throughput."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.first_request = None
+        self.counts = {}
+        self.served = {}
+        self.errors = 0
+        self.throttled = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def begin(self, kind):
+        with self.lock:
+            if self.first_request is None:
+                self.first_request = time.time()
+            self.counts[kind] = self.counts.get(kind, 0) + 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def end(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def record_served(self, kind):
+        with self.lock:
+            self.served[kind] = self.served.get(kind, 0) + 1
+
+    def record_error(self):
+        with self.lock:
+            self.errors += 1
+
+    def record_throttled(self):
+        with self.lock:
+            self.throttled += 1
+
+    def snapshot(self):
+        with self.lock:
+            # Throughput is timed from the first request and only counts places served with a 200
+            elapsed = time.time() - self.first_request if self.first_request else 0.0
+            places = self.served.get('place', 0)
+            return {
+                'elapsed_seconds': round(elapsed, 2),
+                'requests': dict(self.counts),
+                'served': dict(self.served),
+                'errors': self.errors,
+                'throttled': self.throttled,
+                'in_flight': self.in_flight,
+                'max_in_flight': self.max_in_flight,
+                'places_per_minute': round(places / elapsed * 60, 2) if elapsed else 0.0
+            }
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Serve synthetic Google Maps search pages, place pages and images."""
+
+    server_version = 'MapsStandin/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.config['verbose']:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = unquote(url.path)
+        params = parse_qs(url.query)
+
+        if path == '/__stats':
+            self.send_json(self.server.stats.snapshot())
+            return
+
+        if path.startswith('/googleusercontent.com/'):
+            kind = 'image'
+        elif path.startswith('/maps/place/'):
+            kind = 'place'
+        elif path.startswith('/maps/search'):
+            kind = 'search'
+        elif path.rstrip('/') in ('', '/maps'):
+            kind = 'home'
+        else:
+            self.send_error(404)
+            return
+
+        self.server.stats.begin(kind)
+        try:
+            if not self.apply_conditions(kind, params):
+                return
+
+            if kind == 'image':
+                self.send_body(PLACEHOLDER_JPEG, 'image/jpeg')
+                served = True
+            elif kind == 'place':
+                served = self.serve_place(url.path, params)
+            elif kind == 'search':
+                served = self.serve_search(path, params)
+            else:
+                self.send_body(render_page('Google Maps', consent=self.server.config['consent']))
+                served = True
+
+            if served:
+                self.server.stats.record_served(kind)
+        finally:
+            self.server.stats.end()
+
+    def apply_conditions(self, kind, params):
+        """Apply simulated throttling, latency and failures; False if a response was sent."""
+        server = self.server
+        config = server.config
+
+        if config['max_rpm'] and not server.allow_request():
+            server.stats.record_throttled()
+            self.send_failure(kind, params, 429, 'Too Many Requests')
+            return False
+
+        latency = config['image_latency'] if kind == 'image' else config['latency']
+        with server.rng_lock:
+            delay = max(0.0, latency + server.rng.uniform(-config['jitter'], config['jitter']))
+            failed = server.rng.random() < config['error_rate']
+        time.sleep(delay)
+
+        if failed:
+            server.stats.record_error()
+            self.send_failure(kind, params, config['error_status'], 'Something went wrong')
+            return False
+
+        return True
+
+    def serve_search(self, path, params):
+        query = params.get('q', [''])[0]
+        if not query and path.startswith('/maps/search/'):
+            query = unquote_plus(path[len('/maps/search/'):].strip('/'))
+        try:
+            offset = max(0, int(params.get('offset', ['0'])[0]))
+        except ValueError:
+            self.send_error(400, 'Invalid offset')
+            return False
+
+        config = self.server.config
+        results = search_results(self.server.pool, query, config['seed'], config['results_per_query'])
+        page = results[offset:offset + config['page_size']]
+        end = offset + len(page)
+        next_url = ''
+        if end < len(results):
+            next_url = f"/maps/search/?q={quote(query)}&offset={end}&fragment=1"
+
+        if 'fragment' in params:
+            self.send_json({'html': render_feed_items(page), 'next': next_url})
+            return True
+
+        feed = (f'<div role="feed" aria-label="Results for {html.escape(query)}" '
+                f'data-next="{html.escape(next_url)}">{render_feed_items(page)}</div>')
+        self.send_body(render_page(f'{query} - Google Maps', query=query, feed=feed))
+        return True
+
+    def serve_place(self, raw_path, params):
+        match = re.search(r'!1s0x0:0x([0-9a-f]+)', raw_path)
+        place_id = int(match.group(1), 16) if match else 0
+        if not 1 <= place_id <= len(self.server.pool):
+            self.send_error(404)
+            return False
+
+        place = self.server.pool[place_id - 1]
+        pane = render_place_pane(place, place_details(place, self.server.config['seed']))
+
+        if 'pane' in params:
+            self.send_body(pane)
+        else:
+            self.send_body(render_page(f"{place['name']} - Google Maps", query=place['name'], pane=pane))
+        return True
+
+    def send_failure(self, kind, params, status, message):
+        """Fail a request; full pages keep the search box so the crawl can carry on."""
+        if kind == 'image' or 'fragment' in params or 'pane' in params:
+            self.send_error(status, message)
+            return
+
+        query = params.get('q', [''])[0]
+        pane = f'<div role="alert">{html.escape(message)} ({status})</div>'
+        self.send_body(render_page('Google Maps', query=query, pane=pane), status=status)
+
+    def send_json(self, payload):
+        self.send_body(json.dumps(payload), 'application/json')
+
+    def send_body(self, body, content_type='text/html; charset=utf-8', status=200):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StandinServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the place pool, config and stats."""
+
+    daemon_threads = True
+
+    def __init__(self, address, config):
+        super().__init__(address, StandinHandler)
+        self.config = config
+        self.pool = build_place_pool(config['seed'], config['pool_size'])
+        self.stats = StandinStats()
+        self.rng = random.Random(config['seed'])
+        self.rng_lock = threading.Lock()
+        self.recent = deque()
+        self.limiter_lock = threading.Lock()
+
+    def allow_request(self):
+        """Sliding one-minute window limiter used to simulate blocking."""
+        now = time.time()
+        with self.limiter_lock:
+            while self.recent and now - self.recent[0] > 60:
+                self.recent.popleft()
+            if len(self.recent) >= self.config['max_rpm']:
+                return False
+            self.recent.append(now)
+            return True
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Local Google Maps stand-in for offline scraper testing.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', type=int, default=42, help='seed for synthetic places and failures')
+    parser.add_argument('--pool-size', type=int, default=400, help='number of distinct synthetic places')
+    parser.add_argument('--results-per-query', type=int, default=60)
+    parser.add_argument('--page-size', type=int, default=20, help='results loaded per feed scroll')
+    parser.add_argument('--latency', type=float, default=0.2, help='mean page latency in seconds')
+    parser.add_argument('--image-latency', type=float, default=0.1, help='mean image latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.1, help='latency jitter (+/- seconds)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests that fail')
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--max-rpm', type=int, default=0, help='answer 429 above this many requests/minute (0 = off)')
+    parser.add_argument('--no-consent', dest='consent', action='store_false', help='skip the cookie consent banner')
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = vars(args)
+
+    server = StandinServer((args.host, args.port), config)
+    base_url = f"http://{args.host}:{server.server_address[1]}/maps"
+
+    print("🧪 Google Maps stand-in server")
+    print(f"🌐 Serving on: {base_url}")
+    print(f"🏛️ Synthetic places: {len(server.pool)}")
+    print(f"⏱️ Latency: {args.latency}s ± {args.jitter}s, error rate: {args.error_rate:.0%}")
+    print(f"📊 Stats: http://{args.host}:{server.server_address[1]}/__stats")
+    print(f"👉 Run the scraper with MAPS_BASE_URL={base_url}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print("\n📊 SUMMARY:")
+        print(json.dumps(server.stats.snapshot(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
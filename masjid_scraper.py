@@ -13,6 +13,11 @@ import os
 from datetime import datetime
 import requests
 
+# Point these at maps_standin_server.py to crawl offline, e.g.
+# MAPS_BASE_URL=http://127.0.0.1:8765/maps
+MAPS_BASE_URL = os.environ.get('MAPS_BASE_URL', 'https://www.google.com/maps')
+CHROME_DRIVER_PATH = os.environ.get('CHROME_DRIVER_PATH', r"C:\DRIVERS\chromedriver.exe")
+
 def setup_driver():
     """Setup Chrome WebDriver using local driver."""
     try:
@@ -26,7 +31,7 @@ def setup_driver():
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
         # Use local Chrome driver
-        chrome_driver_path = r"C:\DRIVERS\chromedriver.exe"
+        chrome_driver_path = CHROME_DRIVER_PATH
         print(f"  📂 Using local Chrome driver: {chrome_driver_path}")
         
         if not os.path.exists(chrome_driver_path):
@@ -311,8 +316,8 @@ def scrape_all_srinagar_masjids():
             print("❌ Failed to setup Chrome WebDriver")
             return None
         
-        print("🗺️ Navigating to Google Maps...")
-        driver.get("https://www.google.com/maps")
+        print(f"🗺️ Navigating to Google Maps: {MAPS_BASE_URL}")
+        driver.get(MAPS_BASE_URL)
         time.sleep(5)
         
         # Handle cookie consent
@@ -545,7 +550,8 @@ if __name__ == "__main__":
     print("=" * 50)
     print("📋 Will extract: Name, Address, Coordinates, Amenities, Images")
     print("🎯 Target: ALL masjids from every corner of Srinagar")
-    print("🚗 Using local Chrome driver: C:\\DRIVERS\\chromedriver.exe")
+    print(f"🚗 Using local Chrome driver: {CHROME_DRIVER_PATH}")
+    print(f"🗺️ Maps base URL: {MAPS_BASE_URL}")
     print("=" * 50)
     
     df = scrape_all_srinagar_masjids()
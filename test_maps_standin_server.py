@@ -0,0 +1,130 @@
+import json
+import threading
+import unittest
+import urllib.request
+from html.parser import HTMLParser
+from urllib.error import HTTPError
+
+from maps_standin_server import StandinServer, parse_args
+
+# Same pattern masjid_scraper.py uses to pull coordinates out of place links
+COORDS_PATTERN = r'@(-?\d+\.\d+),(-?\d+\.\d+)'
+
+
+class TagCollector(HTMLParser):
+    """Collect (tag, attrs) pairs so selector checks don't depend on markup layout."""
+
+    def __init__(self):
+        super().__init__()
+        self.tags = []
+        self.stack = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        self.tags.append((tag, attrs, [a for _, a in self.stack]))
+        if tag not in ('img', 'input', 'meta'):
+            self.stack.append((tag, attrs))
+
+    def handle_endtag(self, tag):
+        if self.stack and self.stack[-1][0] == tag:
+            self.stack.pop()
+
+
+def parse_tags(body):
+    collector = TagCollector()
+    collector.feed(body)
+    return collector.tags
+
+
+class StandinServerTest(unittest.TestCase):
+    """Smoke-check the page contract masjid_scraper.py relies on."""
+
+    def start_server(self, *extra_args):
+        args = ['--port', '0', '--latency', '0', '--jitter', '0', '--image-latency', '0']
+        server = StandinServer(('127.0.0.1', 0), vars(parse_args(args + list(extra_args))))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    def fetch(self, url):
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                return response.status, response.headers.get('Content-Type'), response.read()
+        except HTTPError as e:
+            return e.code, e.headers.get('Content-Type'), e.read()
+
+    def test_scraper_contract(self):
+        base = self.start_server()
+
+        status, _, body = self.fetch(base + '/maps')
+        self.assertEqual(status, 200)
+        self.assertTrue(any(attrs.get('id') == 'searchboxinput' for _, attrs, _ in parse_tags(body.decode())))
+
+        status, _, body = self.fetch(base + '/maps/search?q=Masjids+in+Soura')
+        self.assertEqual(status, 200)
+        tags = parse_tags(body.decode())
+        self.assertTrue(any(attrs.get('id') == 'searchboxinput' for _, attrs, _ in tags))
+        self.assertTrue(any(tag == 'div' and attrs.get('role') == 'feed' for tag, attrs, _ in tags))
+
+        links = [attrs['href'] for tag, attrs, _ in tags if tag == 'a' and '/maps/place/' in attrs.get('href', '')]
+        self.assertTrue(links)
+        for href in links:
+            self.assertRegex(href, COORDS_PATTERN)
+
+        feed = [attrs for tag, attrs, _ in tags if attrs.get('role') == 'feed'][0]
+        status, _, body = self.fetch(base + feed['data-next'])
+        self.assertEqual(status, 200)
+        self.assertIn('/maps/place/', json.loads(body)['html'])
+
+        # Find a place with an image; most synthetic places have one
+        image_src = None
+        for href in links:
+            status, _, body = self.fetch(base + href + '?pane=1')
+            self.assertEqual(status, 200)
+            pane = parse_tags(body.decode())
+            for tag, attrs, parents in pane:
+                if tag == 'img' and any(p.get('class') == 'ZKCDEc' for p in parents):
+                    image_src = attrs['src']
+            if image_src and any(tag == 'button' and attrs.get('data-item-id') == 'address'
+                                 for tag, attrs, _ in pane):
+                break
+        self.assertIsNotNone(image_src)
+        self.assertIn('googleusercontent.com', image_src)
+
+        status, content_type, body = self.fetch(base + image_src)
+        self.assertEqual(status, 200)
+        self.assertEqual(content_type, 'image/jpeg')
+        self.assertTrue(body.startswith(b'\xff\xd8'))
+        self.assertTrue(body.endswith(b'\xff\xd9'))
+
+        status, _, body = self.fetch(base + '/__stats')
+        stats = json.loads(body)
+        self.assertGreater(stats['served']['place'], 0)
+        self.assertEqual(stats['errors'], 0)
+
+    def test_failed_pages_keep_search_box(self):
+        base = self.start_server('--error-rate', '1')
+
+        status, _, body = self.fetch(base + '/maps/search?q=Masjids+in+Soura')
+        self.assertEqual(status, 503)
+        self.assertTrue(any(attrs.get('id') == 'searchboxinput' for _, attrs, _ in parse_tags(body.decode())))
+
+        status, _, body = self.fetch(base + '/__stats')
+        stats = json.loads(body)
+        self.assertEqual(stats['served'], {})
+        self.assertEqual(stats['places_per_minute'], 0.0)
+
+    def test_bad_offset(self):
+        base = self.start_server()
+
+        status, _, _ = self.fetch(base + '/maps/search?q=x&offset=abc')
+        self.assertEqual(status, 400)
+
+        _, _, clamped = self.fetch(base + '/maps/search?q=x&offset=-5&fragment=1')
+        _, _, first = self.fetch(base + '/maps/search?q=x&offset=0&fragment=1')
+        self.assertEqual(clamped, first)
+
+
+if __name__ == "__main__":
+    unittest.main()